@@ -4,43 +4,165 @@ Helper script to list all available component keys from components_mapping.json
 Useful for Jenkins integration and manual component selection.
 """
 
-import json
+import mmap
 import os
 import sys
-from pathlib import Path
 
+try:
+    import ijson
+except ImportError:  # Optional: fall back to loading the whole file with json
+    ijson = None
 
-def main():
-    # Get project root (parent of scripts/)
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent
-    mapping_file = project_root / "config" / "components_mapping.json"
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json is used when orjson is missing
+    orjson = None
+
+# json.JSONDecodeError, orjson.JSONDecodeError and UnicodeDecodeError are all
+# ValueErrors; ijson reports malformed input as JSONError (IncompleteJSONError
+# for truncated files), which is not
+_STREAM_ERRORS = (ijson.JSONError,) if ijson else ()
+
+# Sentinel for entries without a component_key (None is a valid JSON value)
+_MISSING = object()
+
+# Parsed keys are cached per user, like the main script's region cache, and
+# as JSON: loading the cache must never be able to run code
+_CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".cache", "s3-component-replacer", "component_keys.json"
+)
+
+
+def _load_mappings(mapping_file):
+    """Parse the whole mapping file, preferring orjson when it is installed."""
+    if orjson is not None:
+        # orjson parses bytes directly, skipping the separate UTF-8 decode step.
+        # Map the file so it reads straight from the page cache without a copy.
+        with open(mapping_file, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return orjson.loads(b"")  # mmap rejects empty files
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+            finally:
+                mm.close()
+    import json
+
+    with open(mapping_file, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _read_component_keys(mapping_file):
+    """Return the sorted, unique component_key values from the mapping file."""
+    if ijson is not None:
+        # Stream only the component_key fields instead of building every mapping dict.
+        # Memory stays O(unique keys); the whole file is still read because any
+        # later entry may introduce a new key, so there is no safe early exit.
+        with open(mapping_file, "rb") as f:
+            return sorted(set(ijson.items(f, "item.component_key")))
+
+    mappings = _load_mappings(mapping_file)
+
+    # Extract unique component keys and sort them (one dict lookup per entry;
+    # legacy string entries carry no component_key and are skipped)
+    component_keys = set()
+    for m in mappings:
+        if isinstance(m, dict):
+            key = m.get("component_key", _MISSING)
+            if key is not _MISSING:
+                component_keys.add(key)
+    return sorted(component_keys)
+
+
+def _load_cached_keys(cache_file, mapping_file, st):
+    """Return keys from the cache if it was written for this mapping file's path, mtime and size."""
+    try:
+        with open(cache_file, "rb") as f:
+            raw = f.read()
+        if orjson is not None:
+            cached = orjson.loads(raw)
+        else:
+            import json
+
+            cached = json.loads(raw)
+    except (OSError, ValueError):
+        # Missing, unreadable or corrupt cache; parse the mapping file instead
+        return None
+    if (
+        isinstance(cached, dict)
+        and cached.get("mapping_file") == mapping_file
+        and cached.get("mtime_ns") == st.st_mtime_ns
+        and cached.get("size") == st.st_size
+        and isinstance(cached.get("keys"), list)
+    ):
+        return cached["keys"]
+    return None
+
+
+def _store_cached_keys(cache_file, mapping_file, st, sorted_keys):
+    """Write the cache atomically; failures (e.g. read-only home) are ignored."""
+    import json
+
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        temp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "mapping_file": mapping_file,
+                    "mtime_ns": st.st_mtime_ns,
+                    "size": st.st_size,
+                    "keys": sorted_keys,
+                },
+                f,
+            )
+        os.replace(temp_file, cache_file)
+    except OSError:
+        pass
+
+
+def main(mapping_file=None, cache_file=_CACHE_FILE):
+    if mapping_file is None:
+        # Get project root (parent of scripts/)
+        # (os.path instead of pathlib keeps the import cost off the CLI's cold start)
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        project_root = os.path.dirname(script_dir)
+        mapping_file = os.path.join(project_root, "config", "components_mapping.json")
     
-    if not mapping_file.exists():
+    if not os.path.exists(mapping_file):
         print(f"Error: {mapping_file} not found", file=sys.stderr)
         sys.exit(1)
     
     try:
-        with open(mapping_file, "r", encoding="utf-8") as f:
-            mappings = json.load(f)
-        
-        # Extract unique component keys
-        component_keys = set()
-        for mapping in mappings:
-            if "component_key" in mapping:
-                component_keys.add(mapping["component_key"])
-        
-        # Sort and print
-        sorted_keys = sorted(component_keys)
-        
-        print(f"Available component keys ({len(sorted_keys)} total):\n")
-        for key in sorted_keys:
-            print(f"  {key}")
+        st = os.stat(mapping_file)
+        # Parsed keys are cached, keyed by the mapping file's path, mtime and size
+        sorted_keys = _load_cached_keys(cache_file, os.path.abspath(mapping_file), st)
+        if sorted_keys is None:
+            sorted_keys = _read_component_keys(mapping_file)
+            _store_cached_keys(cache_file, os.path.abspath(mapping_file), st, sorted_keys)
         
-        print(f"\nComma-separated list:")
-        print(",".join(sorted_keys))
+        # Print everything with a single write instead of one print() per key.
+        # Both sections join the same sorted list; the indented lines come from
+        # one join with an indenting separator rather than a string per key.
+        key_lines = "  " + "\n  ".join(sorted_keys) + "\n" if sorted_keys else ""
+        output = (
+            f"Available component keys ({len(sorted_keys)} total):\n\n"
+            + key_lines
+            + "\nComma-separated list:\n"
+            + ",".join(sorted_keys)
+            + "\n"
+        )
+        # Write UTF-8 bytes straight to the binary buffer, bypassing TextIOWrapper
+        stdout_buffer = getattr(sys.stdout, "buffer", None)
+        if stdout_buffer is not None:
+            stdout_buffer.write(output.encode("utf-8"))
+        else:
+            sys.stdout.write(output)
         
-    except json.JSONDecodeError as e:
+    except (ValueError, *_STREAM_ERRORS) as e:
         print(f"Error: Invalid JSON in {mapping_file}: {e}", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
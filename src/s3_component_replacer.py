@@ -6,16 +6,33 @@ Reads component configurations from JSON files and processes replacements.
 """
 
 import argparse
+import itertools
 import json
 import logging
 import os
+import queue
 import re
 import sys
-from typing import Dict, List, Optional, Tuple
-
-import boto3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlencode
+
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+try:
+    import ijson
+except ImportError:  # Optional: config files are loaded whole instead
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json parses whole files when missing
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -24,6 +41,102 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Per-thread list of held-back records; None when the thread logs directly
+_thread_log = threading.local()
+
+
+def _hold_thread_records(record: logging.LogRecord) -> bool:
+    """Logger filter: hold back the records of a thread buffering its output."""
+    records = getattr(_thread_log, "records", None)
+    if records is None:
+        return True
+    records.append(record)
+    return False
+
+
+logger.addFilter(_hold_thread_records)
+
+# Project root (parent of src/), resolved once at import
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Default number of components copied concurrently (each copy is network-bound)
+DEFAULT_MAX_WORKERS = 32
+
+# Connection pool sized above the worker count so threads never wait for a
+# connection; adaptive retries back off on S3 throttling (503 SlowDown).
+# Keepalive holds pooled connections open between requests, and virtual-hosted
+# addressing sends each request straight to the bucket's endpoint. A short
+# connect timeout fails fast (and retries) on unreachable endpoints.
+_S3_CONFIG = Config(
+    max_pool_connections=64,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    tcp_keepalive=True,
+    s3={"addressing_style": "virtual"},
+    connect_timeout=5,
+    read_timeout=60,
+)
+
+# copy_object accepts sources up to 5 GiB; larger files are copied in
+# parallel UploadPartCopy parts instead
+_MAX_SINGLE_COPY_SIZE = 5 * 1024 ** 3
+_MULTIPART_PART_SIZE = 100 * 1024 ** 2
+_MULTIPART_MAX_PARTS = 10000
+_MULTIPART_MAX_WORKERS = 10
+
+# Object headers and user metadata copy_object carries over from the source;
+# a multipart upload must set them explicitly (from the source's head_object)
+_COPIED_OBJECT_FIELDS = (
+    "ContentType",
+    "CacheControl",
+    "ContentEncoding",
+    "ContentDisposition",
+    "ContentLanguage",
+    "Expires",
+    "WebsiteRedirectLocation",
+    "Metadata",
+)
+
+# Errors raised for malformed JSON by the available parsers
+# (orjson.JSONDecodeError subclasses json.JSONDecodeError)
+_JSON_ERRORS = (json.JSONDecodeError,) + ((ijson.JSONError,) if ijson else ())
+
+# Sessions and S3 clients already built by get_s3_client. Keys identify the
+# credentials by profile and access key ID only; secrets are never kept as
+# cache keys.
+_session_cache: Dict[Tuple[Optional[str], Optional[str]], Any] = {}
+_client_cache: Dict[Tuple[Optional[str], Optional[str], str], Any] = {}
+
+# Deletes the newlines that copy/pasted credentials often carry
+_CRED_TRANS = str.maketrans("", "", "\r\n")
+
+# Regions already detected per bucket (a bucket's region never changes),
+# persisted between runs so repeat invocations skip detection
+_region_cache: Dict[str, str] = {}
+_REGION_CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".cache", "s3-component-replacer", "regions.json"
+)
+# Error codes S3 returns when a request is sent to the wrong region; only
+# these mean a cached region is stale
+_REGION_MISMATCH_CODES = ("AuthorizationHeaderMalformed", "PermanentRedirect")
+
+# Environment prefixes stripped from configured paths. Each is a single
+# path segment, so a match is removed by splitting at the first "/".
+_KNOWN_PREFIXES = ("dev/", "stage/", "prd/", "prod/")
+
+# Separator line under each component's progress header
+_SEPARATOR = "-" * 80
+
+# Precompiled patterns for component name parsing (called once per component)
+# Trailing version including dotted versions (e.g., "-3.86.0")
+_TRAILING_VER_RE = re.compile(r"-\d+(\.\d+)*$")
+# Common uppercase prefixes (KP-, FE-, IN-, etc.)
+_PREFIX_RE = re.compile(r"^[A-Z]+-")
+# Trailing suffixes stripped in one pass, in the order they appear: special
+# words (e.g., "-MinSpinTimePOC", "-HolidayDrops-Dev"), then a "V2" and a "-V2"
+# version suffix. Matches what stripping "-V2", "V2" and the words one after
+# another from the end would leave.
+_SUFFIX_RE = re.compile(r"(?:-[A-Za-z]+(?:-[A-Za-z]+)*)?(?:V\d+)?(?:-V\d+)?$")
+
 
 def extract_version(component_name: str) -> str:
     """
@@ -48,17 +161,17 @@ def extract_version(component_name: str) -> str:
         >>> extract_version("Component-F-202")
         '202'
     """
-    # Match the last number sequence at the end of the string
-    # Must be preceded by a dash or dot to be considered a version number
-    # This ensures we only match trailing version numbers, not numbers in "V1", etc.
-    # Examples: "Component-A-V1-19" -> "19", "Component-B-227" -> "227"
-    # But "Component-A-V1" should not match (no dash before the "1")
-    match = re.search(r"[-.](\d+)$", component_name)
-    if match:
-        return match.group(1)
-    else:
-        raise ValueError(
-            f"No version number found in component name: {component_name}")
+    # The text after the last dash (or dot, for "03.12.2025") is the version
+    # when it is all digits; if neither is, the name has no trailing version
+    # (e.g., "Component-A-V1", where no dash precedes the "1"). A single
+    # trailing newline is ignored, as the regex's "$" anchor once allowed.
+    name = component_name[:-1] if component_name.endswith("\n") else component_name
+    for separator in ("-", "."):
+        _, found, tail = name.rpartition(separator)
+        if found and tail.isdecimal():
+            return tail
+    raise ValueError(
+        f"No version number found in component name: {component_name}")
 
 
 def construct_file_name(pattern: str, version: str) -> str:
@@ -103,11 +216,8 @@ def construct_paths(
     base_path = base_path.lstrip("/")
 
     # Strip known prefixes (dev/, stage/, prd/, etc.)
-    known_prefixes = ["dev/", "stage/", "prd/", "prod/"]
-    for prefix in known_prefixes:
-        if base_path.startswith(prefix):
-            base_path = base_path[len(prefix):]
-            break
+    if base_path.startswith(_KNOWN_PREFIXES):
+        base_path = base_path.partition("/")[2]
 
     # Handle empty path
     if not base_path:
@@ -145,19 +255,43 @@ def extract_component_identifier(component_name: str) -> str:
         'slotmachine'
     """
     # Remove version numbers at the end (including dotted versions like 3.86.0)
-    identifier = re.sub(r"-\d+(\.\d+)*$", "", component_name)
+    identifier = _TRAILING_VER_RE.sub("", component_name)
     # Remove common prefixes (KP-, FE-, IN-, etc.)
-    identifier = re.sub(r"^[A-Z]+-", "", identifier)
-    # Remove version suffixes (V2, V1, etc.) - both with and without dash
-    identifier = re.sub(r"-V\d+$", "", identifier)
-    identifier = re.sub(r"V\d+$", "", identifier)
-    # Remove special suffixes like "MinSpinTimePOC", "HolidayDrops-Dev"
-    identifier = re.sub(r"-[A-Za-z]+(-[A-Za-z]+)*$", "", identifier)
+    identifier = _PREFIX_RE.sub("", identifier)
+    # Remove version suffixes (V2, -V2) and special suffixes like
+    # "MinSpinTimePOC", "HolidayDrops-Dev". The version and prefix passes above
+    # stay separate: folding them in changes names like "AB-5" or "KP-Foo".
+    identifier = _SUFFIX_RE.sub("", identifier, count=1)
     # Normalize to lowercase
     identifier = identifier.lower()
     return identifier
 
 
+@lru_cache(maxsize=4096)
+def _relative_key(path_format: str, version: str) -> str:
+    """
+    Resolve a path_format to its S3 key without any environment prefix.
+
+    Args:
+        path_format: Full path format with {0} or {version} placeholder
+        version: Version string to replace placeholder
+
+    Returns:
+        Key relative to the environment prefix (e.g., "krembo/krembo_core/krembo.19.min.js")
+    """
+    # Replace version placeholder (support both {0} and {version} for backward compatibility)
+    path = path_format.replace("{0}", version).replace("{version}", version)
+
+    # Normalize leading slash
+    path = path.lstrip("/")
+
+    # Strip known prefixes if present (dev/, stage/, prd/, etc.)
+    if path.startswith(_KNOWN_PREFIXES):
+        path = path.partition("/")[2]
+
+    return path
+
+
 def construct_s3_key_from_path_format(
     path_format: str, version: str, prefix: str = "dev"
 ) -> str:
@@ -177,21 +311,121 @@ def construct_s3_key_from_path_format(
         >>> construct_s3_key_from_path_format("/krembo/krembo_components/krembo_core/krembo.{0}.min.js", "19", "dev")
         'dev/krembo/krembo_components/krembo_core/krembo.19.min.js'
     """
-    # Replace version placeholder (support both {0} and {version} for backward compatibility)
-    path = path_format.replace("{0}", version).replace("{version}", version)
+    # Add the specified prefix
+    return f"{prefix}/{_relative_key(path_format, version)}"
 
-    # Normalize leading slash
-    path = path.lstrip("/")
 
-    # Strip known prefixes if present (dev/, stage/, prd/, etc.)
-    known_prefixes = ["dev/", "stage/", "prd/", "prod/"]
-    for known_prefix in known_prefixes:
-        if path.startswith(known_prefix):
-            path = path[len(known_prefix):]
-            break
+def _s3_key_exists(s3_client, bucket_name: str, key: str) -> Optional[bool]:
+    """
+    Check whether an S3 key exists by listing it as a single-key prefix.
 
-    # Add the specified prefix
-    return f"{prefix}/{path}"
+    A missing key is an ordinary empty listing rather than a 404 ClientError.
+
+    Args:
+        s3_client: Boto3 S3 client instance
+        bucket_name: S3 bucket name
+        key: Full S3 key to look for
+
+    Returns:
+        True or False, or None if the listing failed (e.g., no s3:ListBucket
+        permission) and the caller should fall back to head_object
+    """
+    try:
+        response = s3_client.list_objects_v2(
+            Bucket=bucket_name, Prefix=key, MaxKeys=1)
+    except ClientError as e:
+        logger.debug("Could not list s3://%s/%s: %s", bucket_name, key, e)
+        return None
+    # The key itself sorts first among keys sharing it as a prefix
+    contents = response.get("Contents", [])
+    return bool(contents) and contents[0]["Key"] == key
+
+
+def _multipart_copy(
+    s3_client,
+    bucket_name: str,
+    source_key: str,
+    destination_key: str,
+    source_head: Dict[str, Any],
+) -> None:
+    """
+    Copy an object too large for copy_object using parallel UploadPartCopy calls.
+
+    The multipart upload is aborted if any step fails, so no orphaned parts
+    are left behind.
+
+    Args:
+        s3_client: Boto3 S3 client instance
+        bucket_name: S3 bucket name
+        source_key: Full S3 key of the source file
+        destination_key: Full S3 key of the destination file
+        source_head: head_object response for the source, giving its size and
+                     the headers and metadata the copy keeps
+
+    Raises:
+        ClientError: If creating, copying a part of, or completing the upload fails
+    """
+    copy_source = {"Bucket": bucket_name, "Key": source_key}
+    size = source_head["ContentLength"]
+    # Parts grow past the default size when needed to stay within S3's part
+    # limit (a 5 TiB source then uses parts of about 524 MiB)
+    part_size = max(_MULTIPART_PART_SIZE, -(-size // _MULTIPART_MAX_PARTS))
+    part_count = -(-size // part_size)
+    # Keep the source's content type, caching headers, metadata and tags, as
+    # copy_object does, so the copy is served the same way
+    object_fields = {
+        field: source_head[field]
+        for field in _COPIED_OBJECT_FIELDS
+        if source_head.get(field)
+    }
+    tag_set = s3_client.get_object_tagging(
+        Bucket=bucket_name, Key=source_key)["TagSet"]
+    if tag_set:
+        object_fields["Tagging"] = urlencode(
+            [(tag["Key"], tag["Value"]) for tag in tag_set])
+    upload_id = s3_client.create_multipart_upload(
+        Bucket=bucket_name,
+        Key=destination_key,
+        ChecksumAlgorithm="CRC32C",
+        **object_fields,
+    )["UploadId"]
+    logger.info("Copying %d bytes in %d parts", size, part_count)
+
+    def copy_part(part_number: int) -> Dict[str, object]:
+        start = (part_number - 1) * part_size
+        end = min(start + part_size, size) - 1
+        result = s3_client.upload_part_copy(
+            Bucket=bucket_name,
+            Key=destination_key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            CopySource=copy_source,
+            CopySourceRange=f"bytes={start}-{end}",
+        )["CopyPartResult"]
+        part = {"PartNumber": part_number, "ETag": result["ETag"]}
+        if "ChecksumCRC32C" in result:
+            part["ChecksumCRC32C"] = result["ChecksumCRC32C"]
+        return part
+
+    try:
+        with ThreadPoolExecutor(
+            max_workers=min(_MULTIPART_MAX_WORKERS, part_count)
+        ) as executor:
+            parts = list(executor.map(copy_part, range(1, part_count + 1)))
+        s3_client.complete_multipart_upload(
+            Bucket=bucket_name,
+            Key=destination_key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+    except Exception:
+        try:
+            s3_client.abort_multipart_upload(
+                Bucket=bucket_name, Key=destination_key, UploadId=upload_id)
+        except ClientError as e:
+            logger.warning(
+                "Could not abort multipart upload %s: %s", upload_id, e)
+        raise
 
 
 def copy_component_file(
@@ -202,6 +436,8 @@ def copy_component_file(
     source_prefix: str = "dev",
     destination_prefix: str = "stage",
     dry_run: bool = False,
+    existing_keys: Optional[Set[str]] = None,
+    listed_prefixes: Optional[Set[str]] = None,
 ) -> bool:
     """
     Copy component file from source path to destination path in S3.
@@ -214,6 +450,11 @@ def copy_component_file(
         source_prefix: Source path prefix (e.g., "dev", "stage", "prd")
         destination_prefix: Destination path prefix (e.g., "stage", "prd")
         dry_run: If True, only validate and show what would be done without actually copying
+        existing_keys: Keys known to exist from build_existence_set. In dry-run, a
+                       source key found here skips the source existence check.
+        listed_prefixes: Prefixes fully listed by build_existence_set. In dry-run,
+                         a source key under one of them but not in existing_keys
+                         is known to be missing without another request.
 
     Returns:
         True if copy was successful (or would be successful in dry-run), False otherwise
@@ -232,122 +473,131 @@ def copy_component_file(
         logger.info(
             f"Extracted version '{version}' from component '{component_name}'")
 
-        # Construct S3 keys from path_format
-        source_key = construct_s3_key_from_path_format(
-            path_format, version, source_prefix
-        )
-        destination_key = construct_s3_key_from_path_format(
-            path_format, version, destination_prefix
-        )
+        # Construct S3 keys from path_format (normalized once for both keys)
+        relative_key = _relative_key(path_format, version)
+        source_key = f"{source_prefix}/{relative_key}"
+        destination_key = f"{destination_prefix}/{relative_key}"
 
-        # Extract file name for logging
-        file_name = os.path.basename(source_key)
+        # Split keys into directory path and file name for logging
+        # (construct_s3_key_from_path_format only produces forward slashes)
+        source_path, _, file_name = source_key.rpartition("/")
+        destination_path = destination_key.rpartition("/")[0]
         logger.info(f"Using path_format: {path_format}")
         logger.info(f"Constructed file name: {file_name}")
         logger.info(f"Source key: {source_key}")
         logger.info(f"Destination key: {destination_key}")
 
-        # Extract directory paths for logging (remove filename from key)
-        source_path = os.path.dirname(source_key).replace("\\", "/")
-        destination_path = os.path.dirname(destination_key).replace("\\", "/")
-
-        # Check if the file exists in the source using head_object
-        logger.debug(
-            f"Checking if file exists: s3://{bucket_name}/{source_key}")
-        source_exists = False
-        try:
-            # Use head_object to check if the file exists
-            response = s3_client.head_object(
-                Bucket=bucket_name, Key=source_key)
-            source_exists = True
-            logger.info(f"File {file_name} found in {source_path}")
-            if logger.level <= logging.DEBUG:
-                logger.debug(
-                    f"File size: {response.get('ContentLength', 'unknown')} bytes"
-                )
-                logger.debug(
-                    f"Last modified: {response.get('LastModified', 'unknown')}"
-                )
-        except ClientError as e:
-            error_code = e.response["Error"]["Code"]
-            if error_code == "404":
-                # File doesn't exist - this is expected for missing files
+        if dry_run:
+            # Check if the file exists in the source. Dry-run cannot attempt the
+            # copy, so it probes first; real copies skip the probe because
+            # copy_object itself reports a missing source (NoSuchKey).
+            logger.debug(
+                "Checking if file exists: s3://%s/%s", bucket_name, source_key)
+            if existing_keys is not None and source_key in existing_keys:
+                # Already confirmed by the batched listing, no request needed
+                source_exists = True
+            elif listed_prefixes is not None and f"{source_path}/" in listed_prefixes:
+                # The whole directory was listed without this key: it is missing
                 source_exists = False
-            elif error_code == "403":
-                error_message = e.response["Error"].get(
-                    "Message", "No error message")
-                logger.error(
-                    "Permission denied (403) when checking source file.")
-                logger.error(f"Path: s3://{bucket_name}/{source_key}")
-                logger.error(f"AWS Error Message: {error_message}")
-                logger.error("This usually means:")
-                logger.error(
-                    "  1. Your AWS credentials don't have s3:GetObject permission for this path"
-                )
-                logger.error("  2. The bucket policy denies access")
-                logger.error("  3. Your credentials are invalid or expired")
-                logger.error("  4. The session token may have expired")
-                logger.error(
-                    "Please check your AWS credentials and S3 bucket permissions."
-                )
-                # Log additional debug info if available
-                if logger.level <= logging.DEBUG:
-                    logger.debug(f"Full error response: {e.response}")
-                return False
             else:
+                source_exists = _s3_key_exists(
+                    s3_client, bucket_name, source_key)
+            if source_exists:
+                logger.info(f"File {file_name} found in {source_path}")
+            elif source_exists is None:
+                # Listing not permitted: fall back to head_object, whose
+                # errors explain the permission problem
+                try:
+                    # Use head_object to check if the file exists
+                    response = s3_client.head_object(
+                        Bucket=bucket_name, Key=source_key)
+                    source_exists = True
+                    logger.info(f"File {file_name} found in {source_path}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "File size: %s bytes",
+                            response.get("ContentLength", "unknown"))
+                        logger.debug(
+                            "Last modified: %s",
+                            response.get("LastModified", "unknown"))
+                except ClientError as e:
+                    error_code = e.response["Error"]["Code"]
+                    if error_code == "404":
+                        # File doesn't exist - this is expected for missing files
+                        source_exists = False
+                    elif error_code == "403":
+                        error_message = e.response["Error"].get(
+                            "Message", "No error message")
+                        logger.error(
+                            "Permission denied (403) when checking source file.")
+                        logger.error(f"Path: s3://{bucket_name}/{source_key}")
+                        logger.error(f"AWS Error Message: {error_message}")
+                        logger.error("This usually means:")
+                        logger.error(
+                            "  1. Your AWS credentials don't have s3:GetObject permission for this path"
+                        )
+                        logger.error("  2. The bucket policy denies access")
+                        logger.error("  3. Your credentials are invalid or expired")
+                        logger.error("  4. The session token may have expired")
+                        logger.error(
+                            "Please check your AWS credentials and S3 bucket permissions."
+                        )
+                        # Log additional debug info if available
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Full error response: %s", e.response)
+                        return False
+                    else:
+                        logger.error(
+                            f"AWS error ({error_code}) when checking source file: {e.response['Error'].get('Message', str(e))}"
+                        )
+                        return False
+
+            if not source_exists:
                 logger.error(
-                    f"AWS error ({error_code}) when checking source file: {e.response['Error'].get('Message', str(e))}"
+                    f"File {file_name} does not exist in {source_path}. Skipping..."
                 )
                 return False
 
-        if not source_exists:
-            logger.error(
-                f"File {file_name} does not exist in {source_path}. Skipping..."
-            )
-            return False
-
-        # Check if the file exists in the destination using head_object
-        destination_exists = False
-        try:
-            s3_client.head_object(Bucket=bucket_name, Key=destination_key)
-            destination_exists = True
-            if dry_run:
+            # Probe the destination: reporting whether the copy would overwrite
+            # is the point of dry-run. copy_object overwrites unconditionally,
+            # so real copies skip this extra request.
+            destination_exists = _s3_key_exists(
+                s3_client, bucket_name, destination_key)
+            if destination_exists is None:
+                try:
+                    s3_client.head_object(
+                        Bucket=bucket_name, Key=destination_key)
+                    destination_exists = True
+                except ClientError as e:
+                    error_code = e.response["Error"]["Code"]
+                    if error_code == "404":
+                        # File doesn't exist - this is expected
+                        destination_exists = False
+                    elif error_code == "403":
+                        logger.warning(
+                            "Permission denied (403) when checking destination file."
+                        )
+                        logger.warning(
+                            f"Path: s3://{bucket_name}/{destination_key}")
+                        logger.warning("Will attempt to copy anyway...")
+                    else:
+                        logger.warning(
+                            f"AWS error ({error_code}) when checking destination file: {e.response['Error'].get('Message', str(e))}"
+                        )
+                        logger.warning("Will attempt to copy anyway...")
+            if destination_exists:
                 logger.info(
                     f"[DRY RUN] File {file_name} exists in {destination_path}. Would replace it..."
                 )
-            else:
-                logger.info(
-                    f"File {file_name} exists in {destination_path}. Replacing it..."
-                )
-        except ClientError as e:
-            error_code = e.response["Error"]["Code"]
-            if error_code == "404":
-                # File doesn't exist - this is expected
-                destination_exists = False
-            elif error_code == "403":
-                logger.warning(
-                    "Permission denied (403) when checking destination file."
-                )
-                logger.warning(f"Path: s3://{bucket_name}/{destination_key}")
-                logger.warning("Will attempt to copy anyway...")
-            else:
-                logger.warning(
-                    f"AWS error ({error_code}) when checking destination file: {e.response['Error'].get('Message', str(e))}"
-                )
-                logger.warning("Will attempt to copy anyway...")
-
-        if not destination_exists:
-            if dry_run:
+            elif destination_exists is False:
                 logger.info(
                     f"[DRY RUN] File {file_name} does not exist in {destination_path}. Would upload it..."
                 )
             else:
                 logger.info(
-                    f"File {file_name} does not exist in {destination_path}. Uploading it..."
-                )
+                    "[DRY RUN] Could not determine whether %s exists in %s",
+                    file_name, destination_path)
 
-        # Copy the file from source to destination (skip in dry-run mode)
-        if dry_run:
             logger.info(
                 f"[DRY RUN] Would copy {file_name} from {source_path} to {destination_path}"
             )
@@ -359,67 +609,101 @@ def copy_component_file(
                     "[DRY RUN] Note: Existing file in destination would be overwritten"
                 )
             return True
-        else:
+
+        # Copy the file from source to destination
+        try:
+            copy_source = {"Bucket": bucket_name, "Key": source_key}
             try:
-                copy_source = {"Bucket": bucket_name, "Key": source_key}
+                # Server-side copy: S3 computes and stores a CRC32C checksum for
+                # the new object, nothing is hashed on the client. A single
+                # copy_object request, unlike the managed s3_client.copy(),
+                # which would head the source and split files over 8 MB into
+                # threaded multipart copies.
                 s3_client.copy_object(
-                    CopySource=copy_source, Bucket=bucket_name, Key=destination_key
+                    CopySource=copy_source,
+                    Bucket=bucket_name,
+                    Key=destination_key,
+                    ChecksumAlgorithm="CRC32C",
                 )
-                if destination_exists:
-                    logger.info(
-                        f"Successfully overwrote {file_name} in {destination_path} (replaced existing file)"
-                    )
-                else:
-                    logger.info(
-                        f"Successfully copied {file_name} from {source_path} to {destination_path} (new file)"
-                    )
-                return True
             except ClientError as e:
-                error_code = e.response["Error"]["Code"]
-                error_message = e.response["Error"].get(
-                    "Message", "No error message")
-
-                if error_code == "403":
-                    logger.error("Permission denied (403) when copying file.")
-                    logger.error(f"Source: s3://{bucket_name}/{source_key}")
-                    logger.error(
-                        f"Destination: s3://{bucket_name}/{destination_key}")
-                    logger.error(f"AWS Error Message: {error_message}")
-                    logger.error("")
-                    logger.error("This usually means:")
-                    logger.error(
-                        "  1. Your AWS credentials don't have s3:GetObject permission for the source path"
-                    )
-                    logger.error(
-                        "  2. Your AWS credentials don't have s3:PutObject permission for the destination path"
-                    )
-                    logger.error(
-                        "  3. The bucket policy or object ACL denies access for this specific path"
-                    )
-                    logger.error(
-                        "  4. Your credentials are invalid or expired")
-                    logger.error("")
-                    logger.error(
-                        "Note: Path-specific permissions can cause some files to copy successfully"
-                    )
-                    logger.error(
-                        "while others fail, even within the same bucket.")
-                    logger.error(
-                        "Please check your AWS credentials and S3 bucket permissions for these specific paths."
-                    )
-
-                    # Log additional debug info if available
-                    if logger.level <= logging.DEBUG:
-                        logger.debug(f"Full error response: {e.response}")
-                    return False
-                else:
-                    logger.error(
-                        f"AWS error ({error_code}) when copying file: {error_message}"
-                    )
-                    logger.error(f"Source: s3://{bucket_name}/{source_key}")
-                    logger.error(
-                        f"Destination: s3://{bucket_name}/{destination_key}")
-                    return False
+                # Sources over 5 GiB are rejected with InvalidRequest; only
+                # then is the size fetched, to copy the file in parts
+                if e.response["Error"]["Code"] != "InvalidRequest":
+                    raise
+                source_head = s3_client.head_object(
+                    Bucket=bucket_name, Key=source_key)
+                if source_head["ContentLength"] <= _MAX_SINGLE_COPY_SIZE:
+                    raise
+                _multipart_copy(
+                    s3_client, bucket_name, source_key, destination_key,
+                    source_head)
+            logger.info(
+                f"Successfully copied {file_name} from {source_path} to {destination_path}"
+            )
+            if logger.isEnabledFor(logging.DEBUG):
+                # Size is no longer known from a source probe; fetch it for debugging only
+                try:
+                    response = s3_client.head_object(
+                        Bucket=bucket_name, Key=destination_key)
+                    logger.debug(
+                        "File size: %s bytes",
+                        response.get("ContentLength", "unknown"))
+                except ClientError as e:
+                    logger.debug("Could not read copied file size: %s", e)
+            return True
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            error_message = e.response["Error"].get(
+                "Message", "No error message")
+
+            if error_code in ("NoSuchKey", "404"):
+                logger.error(
+                    f"File {file_name} does not exist in {source_path}. Skipping..."
+                )
+                return False
+            elif error_code in ("AccessDenied", "403"):
+                # CopyObject reports denial as AccessDenied; "403" is the
+                # code of header-only (HEAD-style) error responses
+                logger.error("Permission denied (403) when copying file.")
+                logger.error(f"Source: s3://{bucket_name}/{source_key}")
+                logger.error(
+                    f"Destination: s3://{bucket_name}/{destination_key}")
+                logger.error(f"AWS Error Message: {error_message}")
+                logger.error("")
+                logger.error("This usually means:")
+                logger.error(
+                    "  1. Your AWS credentials don't have s3:GetObject permission for the source path"
+                )
+                logger.error(
+                    "  2. Your AWS credentials don't have s3:PutObject permission for the destination path"
+                )
+                logger.error(
+                    "  3. The bucket policy or object ACL denies access for this specific path"
+                )
+                logger.error(
+                    "  4. Your credentials are invalid or expired")
+                logger.error("")
+                logger.error(
+                    "Note: Path-specific permissions can cause some files to copy successfully"
+                )
+                logger.error(
+                    "while others fail, even within the same bucket.")
+                logger.error(
+                    "Please check your AWS credentials and S3 bucket permissions for these specific paths."
+                )
+
+                # Log additional debug info if available
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Full error response: %s", e.response)
+                return False
+            else:
+                logger.error(
+                    f"AWS error ({error_code}) when copying file: {error_message}"
+                )
+                logger.error(f"Source: s3://{bucket_name}/{source_key}")
+                logger.error(
+                    f"Destination: s3://{bucket_name}/{destination_key}")
+                return False
 
     except KeyError as e:
         logger.error(f"Missing required field in component config: {e}")
@@ -435,6 +719,151 @@ def copy_component_file(
         return False
 
 
+def build_existence_set(
+    s3_client, bucket_name: str, prefixes: Set[str]
+) -> Tuple[Set[str], Set[str]]:
+    """
+    List the keys directly under the given directory prefixes in one batched
+    pass. One list_objects_v2 page covers up to 1,000 keys, replacing a
+    head_object request per component when components share a directory.
+    Nested folders are not descended into (they are rolled up as common
+    prefixes), since component files sit directly in their directory.
+
+    Args:
+        s3_client: Boto3 S3 client instance
+        bucket_name: S3 bucket name
+        prefixes: Directory prefixes to list (e.g., "dev/krembo/krembo_core/")
+
+    Returns:
+        Tuple of (existing_keys, listed_prefixes): the keys found directly
+        under the prefixes, and the prefixes whose listing completed. A key under a
+        listed prefix but absent from existing_keys does not exist. Prefixes
+        that cannot be listed are skipped, so callers must still fall back to
+        per-key checks under them.
+    """
+    existing_keys: Set[str] = set()
+    listed_prefixes: Set[str] = set()
+    paginator = s3_client.get_paginator("list_objects_v2")
+    for prefix in sorted(prefixes):
+        try:
+            for page in paginator.paginate(
+                Bucket=bucket_name, Prefix=prefix, Delimiter="/"
+            ):
+                existing_keys.update(obj["Key"]
+                                     for obj in page.get("Contents", []))
+            listed_prefixes.add(prefix)
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "")
+            logger.warning(
+                f"Could not list s3://{bucket_name}/{prefix} ({error_code}), falling back to per-file checks"
+            )
+    logger.debug(
+        "Listed %d existing key(s) under %d prefix(es)",
+        len(existing_keys), len(listed_prefixes))
+    return existing_keys, listed_prefixes
+
+
+def collect_source_prefixes(
+    components: List[Tuple[str, Dict[str, str]]],
+    source_prefix: str = "dev",
+) -> Set[str]:
+    """
+    Collect the source directory prefixes of already-resolved components.
+    Components without a path_format or version are skipped;
+    copy_component_file reports those errors later.
+
+    Args:
+        components: (component_name, component_config) pairs, as resolved by
+                    find_component_mapping
+        source_prefix: Source path prefix (e.g., "dev", "stage", "prd")
+
+    Returns:
+        Set of directory prefixes with trailing slash (e.g., "dev/krembo/krembo_core/")
+    """
+    prefixes: Set[str] = set()
+    for component_name, component_config in components:
+        if "path_format" not in component_config:
+            continue
+        try:
+            version = extract_version(component_name)
+        except ValueError:
+            continue
+        source_key = construct_s3_key_from_path_format(
+            component_config["path_format"], version, source_prefix
+        )
+        prefixes.add(source_key.rpartition("/")[0] + "/")
+    return prefixes
+
+
+def _iter_json_array(f, error_message: str):
+    """
+    Yield the elements of a top-level JSON array one at a time.
+    Streams with ijson when it is installed, so the full document is never
+    held in memory; otherwise parses the whole file with orjson, or with the
+    stdlib json module if orjson is not installed either.
+
+    Args:
+        f: Binary file object positioned at the start of the JSON document
+        error_message: Message for the ValueError raised on a non-array document
+
+    Yields:
+        Array elements
+    """
+    if ijson is None:
+        # Both parsers take the raw bytes and decode UTF-8 internally
+        raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        if not isinstance(data, list):
+            raise ValueError(error_message)
+        yield from data
+        return
+
+    events = ijson.parse(f)
+    first_event = next(events, None)
+    if first_event is None or first_event[1] != "start_array":
+        raise ValueError(error_message)
+    yield from ijson.items(itertools.chain([first_event], events), "item")
+
+
+def _build_mappings(entries: Iterable[Any]) -> Dict[str, Dict[str, str]]:
+    """
+    Key mapping entries by component_key, validating each one.
+
+    Args:
+        entries: Parsed elements of the mappings JSON array
+
+    Returns:
+        Dictionary mapping component_key to configuration
+
+    Raises:
+        ValueError: If an entry lacks component_key or path_format
+    """
+    mapping_dict: Dict[str, Dict[str, str]] = {}
+    for mapping in entries:
+        if isinstance(mapping, str):
+            # Simple string format (backward compatibility) - skip as it needs component_key
+            logger.warning(
+                f"Skipping string mapping without component_key: {mapping}"
+            )
+            continue
+        elif isinstance(mapping, dict):
+            if "component_key" not in mapping:
+                raise ValueError(
+                    f"Missing required field 'component_key' in mapping entry: {mapping}"
+                )
+
+            # Only support path_format format
+            if "path_format" not in mapping:
+                raise ValueError(
+                    f"Missing required field 'path_format' in mapping entry: {mapping}"
+                )
+            mapping_dict[mapping["component_key"]] = mapping
+        else:
+            logger.warning(
+                f"Skipping invalid mapping entry: {mapping}")
+    return mapping_dict
+
+
 def load_component_mappings(json_file_path: str) -> Dict[str, Dict[str, str]]:
     """
     Load component mappings from JSON file.
@@ -446,43 +875,17 @@ def load_component_mappings(json_file_path: str) -> Dict[str, Dict[str, str]]:
         Dictionary mapping component_key to configuration
     """
     try:
-        with open(json_file_path, "r", encoding="utf-8") as f:
-            mappings = json.load(f)
-
-        if not isinstance(mappings, list):
-            raise ValueError(
-                "JSON file must contain an array of component configurations"
-            )
-
-        # Convert list to dictionary keyed by component_key
-        mapping_dict: Dict[str, Dict[str, str]] = {}
-        for mapping in mappings:
-            if isinstance(mapping, str):
-                # Simple string format (backward compatibility) - skip as it needs component_key
-                logger.warning(
-                    f"Skipping string mapping without component_key: {mapping}"
+        # Convert list to dictionary keyed by component_key, one entry at a time
+        with open(json_file_path, "rb") as f:
+            return _build_mappings(
+                _iter_json_array(
+                    f, "JSON file must contain an array of component configurations"
                 )
-                continue
-            elif isinstance(mapping, dict):
-                if "component_key" not in mapping:
-                    raise ValueError(
-                        f"Missing required field 'component_key' in mapping entry: {mapping}"
-                    )
-
-                # Only support path_format format
-                if "path_format" not in mapping:
-                    raise ValueError(
-                        f"Missing required field 'path_format' in mapping entry: {mapping}"
-                    )
-                mapping_dict[mapping["component_key"]] = mapping
-            else:
-                logger.warning(f"Skipping invalid mapping entry: {mapping}")
-
-        return mapping_dict
+            )
     except FileNotFoundError:
         logger.error(f"Mapping file not found: {json_file_path}")
         return {}
-    except json.JSONDecodeError as e:
+    except _JSON_ERRORS as e:
         logger.error(f"Invalid JSON in mapping file: {e}")
         return {}
     except ValueError:
@@ -504,18 +907,15 @@ def load_component_names(json_file_path: str) -> List[str]:
         List of component names
     """
     try:
-        with open(json_file_path, "r", encoding="utf-8") as f:
-            component_names = json.load(f)
-
-        if not isinstance(component_names, list):
-            raise ValueError(
-                "JSON file must contain an array of component names")
-
-        return component_names
+        with open(json_file_path, "rb") as f:
+            return list(
+                _iter_json_array(
+                    f, "JSON file must contain an array of component names")
+            )
     except FileNotFoundError:
         logger.error(f"Component names file not found: {json_file_path}")
         return []
-    except json.JSONDecodeError as e:
+    except _JSON_ERRORS as e:
         logger.error(f"Invalid JSON in component names file: {e}")
         return []
     except Exception as e:
@@ -524,8 +924,29 @@ def load_component_names(json_file_path: str) -> List[str]:
         return []
 
 
+def build_mapping_index(mappings: Dict[str, Dict[str, str]]) -> List[int]:
+    """
+    Build a lookup index for find_component_mapping.
+    Collects the distinct component_key lengths, longest first, so a lookup
+    probes the mappings dict once per length instead of scanning every key.
+    An empty component_key is left out, so it never matches a component.
+
+    Args:
+        mappings: Dictionary of component_key -> configuration
+
+    Returns:
+        Distinct non-zero component_key lengths in descending order
+    """
+    return sorted(
+        {len(component_key) for component_key in mappings if component_key},
+        reverse=True,
+    )
+
+
 def find_component_mapping(
-    component_name: str, mappings: Dict[str, Dict[str, str]]
+    component_name: str,
+    mappings: Dict[str, Dict[str, str]],
+    index: Optional[List[int]] = None,
 ) -> Optional[Dict[str, str]]:
     """
     Find the best matching mapping configuration for a component name.
@@ -535,6 +956,8 @@ def find_component_mapping(
     Args:
         component_name: Full component name (e.g., "Component-A-V1-19")
         mappings: Dictionary of component_key -> configuration
+        index: Prebuilt index from build_mapping_index(mappings). Pass it when
+               resolving many components so the index is only built once.
 
     Returns:
         Matching configuration dictionary or None if not found
@@ -544,23 +967,20 @@ def find_component_mapping(
         and component_name is "Component-A-V1-19",
         it will return the config for "Component-A-V1" (longer match)
     """
-    best_match: Optional[Tuple[str, Dict[str, str]]] = None
-    best_match_length = 0
-
-    # Find the longest matching component_key
-    for component_key, config in mappings.items():
-        if component_name.startswith(component_key):
-            key_length = len(component_key)
-            # Prefer longer matches (more specific)
-            if key_length > best_match_length:
-                best_match = (component_key, config)
-                best_match_length = key_length
-
-    if best_match:
-        logger.debug(
-            f"Matched component '{component_name}' to key '{best_match[0]}' (length: {best_match_length})"
-        )
-        return best_match[1]
+    if index is None:
+        index = build_mapping_index(mappings)
+
+    # Try each key length, longest first, so the first match is the most specific
+    for length in index:
+        if length > len(component_name):
+            continue
+        component_key = component_name[:length]
+        config = mappings.get(component_key)
+        if config is not None:
+            logger.debug(
+                "Matched component '%s' to key '%s' (length: %d)",
+                component_name, component_key, length)
+            return config
 
     return None
 
@@ -642,22 +1062,22 @@ Examples:
 
     parser.add_argument(
         "--access-key",
-        type=str,
-        default=None,
+        type=_sanitize,
+        default=os.environ.get("AWS_ACCESS_KEY_ID"),
         help="AWS access key ID (can also use AWS_ACCESS_KEY_ID environment variable)",
     )
 
     parser.add_argument(
         "--secret-key",
-        type=str,
-        default=None,
+        type=_sanitize,
+        default=os.environ.get("AWS_SECRET_ACCESS_KEY"),
         help="AWS secret access key (can also use AWS_SECRET_ACCESS_KEY environment variable)",
     )
 
     parser.add_argument(
         "--session-token",
-        type=str,
-        default=None,
+        type=_sanitize,
+        default=os.environ.get("AWS_SESSION_TOKEN"),
         help="AWS session token for temporary credentials (can also use AWS_SESSION_TOKEN environment variable)",
     )
 
@@ -682,10 +1102,26 @@ Examples:
         help="Test mode: validate and show what would be done without actually copying files to S3",
     )
 
-    return parser.parse_args()
+    parser.add_argument(
+        "--skip-preflight",
+        action="store_true",
+        help="Skip the bucket access test before copying (errors then surface per component)",
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Number of components copied in parallel (default: {DEFAULT_MAX_WORKERS})",
+    )
+
+    args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    return args
 
 
-def get_bucket_region(s3_client, bucket_name: str) -> str:
+def get_bucket_region(s3_client, bucket_name: str) -> Tuple[str, bool]:
     """
     Detect the AWS region where an S3 bucket is located.
 
@@ -694,52 +1130,87 @@ def get_bucket_region(s3_client, bucket_name: str) -> str:
         bucket_name: Name of the S3 bucket
 
     Returns:
-        The AWS region where the bucket is located (e.g., 'us-east-1', 'eu-west-1')
+        Tuple of (region, head_ok): the AWS region where the bucket is located
+        (e.g., 'us-east-1', 'eu-west-1'), and whether HeadBucket succeeded.
+        HeadBucket needs s3:ListBucket, so head_ok also confirms bucket access.
+        A cached region makes no request and returns head_ok False.
     """
+    if bucket_name in _region_cache:
+        return _region_cache[bucket_name], False
+
+    # HeadBucket reports the region in the x-amz-bucket-region header, also
+    # on error responses (301 redirect, 400, 403), so a denied request still
+    # yields the region without s3:GetBucketLocation
+    error_code = None
     try:
         response = s3_client.head_bucket(Bucket=bucket_name)
-        # The region is in the response headers
-        region = (
-            response.get("ResponseMetadata", {})
-            .get("HTTPHeaders", {})
-            .get("x-amz-bucket-region")
-        )
-        if region:
-            logger.info(f"Detected bucket region: {region}")
-            return region
-        else:
-            # Fallback: try to get region from bucket location
-            try:
-                location = s3_client.get_bucket_location(Bucket=bucket_name)
-                region = location.get("LocationConstraint")
-                # S3 returns None for us-east-1 (the default region)
-                if region is None or region == "":
-                    region = "us-east-1"
-                logger.info(f"Detected bucket region from location: {region}")
-                return region
-            except Exception:
-                logger.warning(
-                    "Could not detect bucket region, defaulting to us-east-1"
-                )
-                return "us-east-1"
     except ClientError as e:
+        response = e.response
         error_code = e.response.get("Error", {}).get("Code", "")
-        if error_code == "403":
-            logger.warning(
-                "Permission denied when detecting bucket region, defaulting to us-east-1"
-            )
-        else:
-            logger.warning(
-                f"Could not detect bucket region ({error_code}), defaulting to us-east-1"
-            )
-        return "us-east-1"
     except Exception as e:
         logger.warning(
-            f"Error detecting bucket region: {e}, defaulting to us-east-1")
-        return "us-east-1"
+            "Error detecting bucket region: %s, defaulting to us-east-1", e)
+        return "us-east-1", False
+
+    region = (
+        response.get("ResponseMetadata", {})
+        .get("HTTPHeaders", {})
+        .get("x-amz-bucket-region")
+    )
+    if region:
+        logger.info("Detected bucket region: %s", region)
+        _region_cache[bucket_name] = region
+        return region, error_code is None
+
+    if error_code == "403":
+        logger.warning(
+            "Permission denied when detecting bucket region, defaulting to us-east-1"
+        )
+    elif error_code:
+        logger.warning(
+            "Could not detect bucket region (%s), defaulting to us-east-1",
+            error_code,
+        )
+    else:
+        logger.warning("Could not detect bucket region, defaulting to us-east-1")
+    return "us-east-1", False
+
+
+def _region_cache_load() -> None:
+    """
+    Merge bucket regions saved by earlier runs into the in-memory cache.
+
+    A missing or unreadable cache file is ignored.
+    """
+    try:
+        with open(_REGION_CACHE_FILE, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return
+    if isinstance(cached, dict):
+        for bucket_name, region in cached.items():
+            if isinstance(region, str):
+                _region_cache.setdefault(bucket_name, region)
+
 
+def _region_cache_store() -> None:
+    """
+    Save the in-memory bucket region cache for later runs.
 
-def test_s3_access(s3_client, bucket_name: str) -> bool:
+    Failing to write the cache only costs a region lookup next time, so
+    errors are logged and otherwise ignored.
+    """
+    try:
+        os.makedirs(os.path.dirname(_REGION_CACHE_FILE), exist_ok=True)
+        temp_file = f"{_REGION_CACHE_FILE}.{os.getpid()}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(_region_cache, f, indent=2, sort_keys=True)
+        os.replace(temp_file, _REGION_CACHE_FILE)
+    except OSError as e:
+        logger.debug("Could not save region cache: %s", e)
+
+
+def test_s3_access(s3_client, bucket_name: str) -> Tuple[bool, Optional[str]]:
     """
     Test if the S3 client can access the bucket (read permissions).
 
@@ -748,7 +1219,8 @@ def test_s3_access(s3_client, bucket_name: str) -> bool:
         bucket_name: S3 bucket name
 
     Returns:
-        True if access is successful, False otherwise
+        Tuple of (ok, error_code): whether access is successful, and the S3
+        error code of the failed request (None on success or a non-S3 error)
     """
     try:
         # Try to list objects in the bucket (requires s3:ListBucket permission)
@@ -757,13 +1229,14 @@ def test_s3_access(s3_client, bucket_name: str) -> bool:
             Bucket=bucket_name, Prefix="__test_access__", MaxKeys=1
         )
         logger.info(
-            f"Successfully verified S3 access to bucket '{bucket_name}'")
-        return True
+            "Successfully verified S3 access to bucket '%s'", bucket_name)
+        return True, None
     except ClientError as e:
         error_code = e.response["Error"]["Code"]
-        if error_code == "403":
+        # ListObjectsV2 reports denial as AccessDenied
+        if error_code in ("AccessDenied", "403"):
             logger.error(
-                f"Permission denied (403) when accessing bucket '{bucket_name}'"
+                "Permission denied (403) when accessing bucket '%s'", bucket_name
             )
             logger.error("This usually means:")
             logger.error("  1. Your AWS credentials are invalid or expired")
@@ -774,113 +1247,184 @@ def test_s3_access(s3_client, bucket_name: str) -> bool:
                 "  3. The bucket policy denies access to your credentials")
         else:
             logger.warning(
-                f"Could not verify bucket access: {error_code} - {e.response['Error'].get('Message', str(e))}"
+                "Could not verify bucket access: %s - %s",
+                error_code,
+                e.response["Error"].get("Message", str(e)),
             )
-        return False
+        return False, error_code
     except Exception as e:
-        logger.warning(f"Unexpected error testing bucket access: {e}")
-        return False
+        logger.warning("Unexpected error testing bucket access: %s", e)
+        return False, None
 
 
-def get_s3_client(
+def _sanitize(value: Optional[str]) -> Optional[str]:
+    """
+    Strip whitespace from a credential and remove any embedded newlines.
+
+    Args:
+        value: Raw credential value (or None)
+
+    Returns:
+        Sanitized credential, or None if the value is empty or None
+    """
+    return value.strip().translate(_CRED_TRANS) if value else None
+
+
+def _mask(value: Optional[str]) -> str:
+    """
+    Mask a credential for logging, keeping only its first and last 4 characters.
+
+    Args:
+        value: Credential value (e.g., an access key ID)
+
+    Returns:
+        Masked value (e.g., "AKIA...MPLE"), or "****" for short or missing values
+    """
+    return f"{value[:4]}...{value[-4:]}" if value and len(value) > 8 else "****"
+
+
+def get_s3_session(
     access_key: Optional[str],
     secret_key: Optional[str],
     session_token: Optional[str],
     profile: Optional[str],
-    region: str,
 ):
     """
-    Create S3 client with credentials.
+    Create a boto3 session with credentials.
+
+    Credentials are used as given (parse_arguments sanitizes the command-line
+    and environment values); apply _sanitize to raw values first.
 
     Args:
         access_key: AWS access key ID (or None to use environment/default)
         secret_key: AWS secret access key (or None to use environment/default)
         session_token: AWS session token for temporary credentials (or None)
         profile: AWS profile name (or None to use default)
-        region: AWS region
 
     Returns:
-        Boto3 S3 client instance
+        Boto3 Session instance
     """
+    # Imported on first use: loading boto3 is only paid by runs that reach S3,
+    # not by --help or imports of the pure helpers
+    import boto3
+
     # If profile is specified, use boto3 session with that profile
     # This supports AWS SSO profiles and regular AWS profiles
     if profile:
-        logger.info(f"Using AWS profile: {profile}")
+        logger.info("Using AWS profile: %s", profile)
         try:
             session = boto3.Session(profile_name=profile)
             # Verify credentials are available
             credentials = session.get_credentials()
             if credentials:
                 logger.info(
-                    f"Successfully loaded credentials from profile '{profile}'")
+                    "Successfully loaded credentials from profile '%s'", profile)
                 # Log masked access key for debugging
-                if credentials.access_key:
-                    masked_key = (
-                        credentials.access_key[:4] +
-                        "..." + credentials.access_key[-4:]
-                        if len(credentials.access_key) > 8
-                        else "****"
-                    )
-                    logger.debug(f"Using access key: {masked_key}")
+                if logger.isEnabledFor(logging.DEBUG) and credentials.access_key:
+                    logger.debug(
+                        "Using access key: %s", _mask(credentials.access_key))
             else:
                 logger.warning(
-                    f"Profile '{profile}' found but no credentials available. You may need to run: aws sso login --profile {profile}"
+                    "Profile '%s' found but no credentials available. You may need to run: aws sso login --profile %s",
+                    profile,
+                    profile,
                 )
-            return session.client("s3", region_name=region)
+            return session
         except Exception as e:
-            logger.error(f"Failed to load profile '{profile}': {e}")
+            logger.error("Failed to load profile '%s': %s", profile, e)
             logger.error(
-                f"Make sure you're logged in: aws sso login --profile {profile}"
+                "Make sure you're logged in: aws sso login --profile %s", profile
             )
             raise
 
-    # Check environment variables if not provided via arguments
-    if not access_key:
-        access_key = os.environ.get("AWS_ACCESS_KEY_ID")
-    if not secret_key:
-        secret_key = os.environ.get("AWS_SECRET_ACCESS_KEY")
-    if not session_token:
-        session_token = os.environ.get("AWS_SESSION_TOKEN")
-
-    # Sanitize credentials by stripping whitespace and removing all newlines
-    # This prevents issues with copied/pasted credentials that may have trailing newlines
-    # or newlines embedded in the middle
-    if access_key:
-        access_key = access_key.strip().replace("\n", "").replace("\r", "")
-    if secret_key:
-        secret_key = secret_key.strip().replace("\n", "").replace("\r", "")
-    if session_token:
-        session_token = session_token.strip().replace("\n", "").replace("\r", "")
-
-    # Create client with credentials if provided
+    # Create session with credentials if provided
     if access_key and secret_key:
         logger.info(
             "Using AWS credentials from arguments or environment variables")
         # Log masked access key for debugging
-        masked_key = (
-            access_key[:4] + "..." +
-            access_key[-4:] if len(access_key) > 8 else "****"
-        )
-        logger.debug(f"Using access key: {masked_key}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Using access key: %s", _mask(access_key))
         if session_token:
             logger.debug("Using session token (temporary credentials)")
 
-        client_kwargs = {
+        session_kwargs = {
             "aws_access_key_id": access_key,
             "aws_secret_access_key": secret_key,
-            "region_name": region,
         }
         # Add session token if provided (for temporary credentials)
         if session_token:
-            client_kwargs["aws_session_token"] = session_token
+            session_kwargs["aws_session_token"] = session_token
             logger.info("Using AWS session token for temporary credentials")
 
-        return boto3.client("s3", **client_kwargs)
+        return boto3.Session(**session_kwargs)
     else:
         logger.info(
             "Using default AWS credential chain (AWS CLI config, IAM roles, AWS SSO, etc.)"
         )
-        return boto3.client("s3", region_name=region)
+        return boto3.Session()
+
+
+def get_s3_client(
+    access_key: Optional[str],
+    secret_key: Optional[str],
+    session_token: Optional[str],
+    profile: Optional[str],
+    region: str,
+):
+    """
+    Create S3 client with credentials.
+
+    Sessions are cached per (profile, access key ID) and clients per
+    (profile, access key ID, region), so repeated calls reuse the same
+    credential resolution and connection pool, and a client for another
+    region reuses the session.
+
+    Args:
+        access_key: AWS access key ID (or None to use environment/default)
+        secret_key: AWS secret access key (or None to use environment/default)
+        session_token: AWS session token for temporary credentials (or None)
+        profile: AWS profile name (or None to use default)
+        region: AWS region
+
+    Returns:
+        Boto3 S3 client instance
+    """
+    session_key = (profile, access_key)
+    cache_key = (profile, access_key, region)
+    client = _client_cache.get(cache_key)
+    if client is None:
+        session = _session_cache.get(session_key)
+        if session is None:
+            session = get_s3_session(
+                access_key, secret_key, session_token, profile)
+            _session_cache[session_key] = session
+        client = session.client(
+            "s3", region_name=region, config=_S3_CONFIG)
+        _client_cache[cache_key] = client
+    return client
+
+
+def _configure_logging(level: int) -> QueueListener:
+    """
+    Route log records through a queue drained by a single listener thread.
+
+    Copy workers then only enqueue records instead of contending for the
+    console handler's lock on every message.
+
+    Args:
+        level: Logging level for the root logger
+
+    Returns:
+        The started listener, holding the root logger's original handlers
+    """
+    root = logging.getLogger()
+    root.setLevel(level)
+    handlers = root.handlers or [logging.StreamHandler()]
+    log_queue = queue.SimpleQueue()
+    root.handlers = [QueueHandler(log_queue)]
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
 
 
 def main() -> int:
@@ -892,75 +1436,94 @@ def main() -> int:
     """
     args = parse_arguments()
 
-    # Set logging level
-    logging.getLogger().setLevel(getattr(logging, args.log_level))
+    listener = _configure_logging(getattr(logging, args.log_level))
+    try:
+        return _replace_components(args)
+    finally:
+        # Flush queued records and hand the handlers back to the root logger
+        listener.stop()
+        logging.getLogger().handlers = list(listener.handlers)
 
-    # Get the directory where this script is located (src/)
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    # Get the project root directory (parent of src/)
-    project_root = os.path.dirname(script_dir)
 
-    # Resolve file paths (use project root for relative paths)
-    if os.path.isabs(args.mapping_file):
-        mapping_file_path = args.mapping_file
-    else:
-        # Resolve relative paths from project root
-        mapping_file_path = os.path.join(project_root, args.mapping_file)
+def _replace_components(args: argparse.Namespace) -> int:
+    """
+    Copy every listed component from the source to the destination prefix.
 
-    if os.path.isabs(args.components_file):
-        components_file_path = args.components_file
-    else:
-        # Resolve relative paths from project root
-        components_file_path = os.path.join(project_root, args.components_file)
-
-    logger.info(f"Loading component mappings from: {mapping_file_path}")
-    logger.info(f"Loading component names from: {components_file_path}")
-    logger.info(f"Using S3 bucket: {args.bucket}")
-    logger.info(f"Source prefix: {args.source_prefix}")
-    logger.info(f"Destination prefix: {args.destination_prefix}")
-
-    # Sanitize credentials from command-line arguments (strip whitespace and remove newlines)
-    # This handles cases where credentials are copied/pasted with embedded newlines
-    access_key = (
-        args.access_key.strip().replace("\n", "").replace("\r", "")
-        if args.access_key
-        else None
-    )
-    secret_key = (
-        args.secret_key.strip().replace("\n", "").replace("\r", "")
-        if args.secret_key
-        else None
-    )
-    session_token = (
-        args.session_token.strip().replace("\n", "").replace("\r", "")
-        if args.session_token
-        else None
-    )
+    Args:
+        args: Parsed command-line arguments
 
-    # Determine region: use provided region, or auto-detect from bucket
-    initial_region = args.region if args.region else "us-east-1"
+    Returns:
+        Exit code (0 for success, 1 for failure)
+    """
+    # Resolve file paths (use project root for relative paths); os.path.join
+    # returns an absolute second argument unchanged
+    mapping_file_path = os.path.join(_PROJECT_ROOT, args.mapping_file)
+    components_file_path = os.path.join(_PROJECT_ROOT, args.components_file)
+
+    logger.info("Loading component mappings from: %s", mapping_file_path)
+    logger.info("Loading component names from: %s", components_file_path)
+    logger.info("Using S3 bucket: %s", args.bucket)
+    logger.info("Source prefix: %s", args.source_prefix)
+    logger.info("Destination prefix: %s", args.destination_prefix)
+
+    # Credentials were sanitized by parse_arguments (including the
+    # environment variable fallbacks)
+    access_key = args.access_key
+    secret_key = args.secret_key
+    session_token = args.session_token
+
+    # Determine region: use provided region, or auto-detect from bucket.
+    # A region saved by an earlier run is used straight away, so the client
+    # is built once and detection makes no request.
+    cached_region = None
+    if not args.region:
+        _region_cache_load()
+        cached_region = _region_cache.get(args.bucket)
+    initial_region = args.region or cached_region or "us-east-1"
 
     # Initialize S3 client with initial region (us-east-1 or user-specified)
+    region = initial_region
     s3_client = get_s3_client(
-        access_key, secret_key, session_token, args.profile, initial_region
-    )
+        access_key, secret_key, session_token, args.profile, region)
 
     # Auto-detect bucket region if not explicitly provided
+    head_ok = False
     if not args.region:
-        detected_region = get_bucket_region(s3_client, args.bucket)
+        detected_region, head_ok = get_bucket_region(s3_client, args.bucket)
         if detected_region != initial_region:
             logger.info(
-                f"Recreating S3 client with detected region: {detected_region}")
+                "Recreating S3 client with detected region: %s", detected_region)
+            region = detected_region
             s3_client = get_s3_client(
-                access_key, secret_key, session_token, args.profile, detected_region
-            )
-        logger.info(f"Using AWS region: {detected_region}")
+                access_key, secret_key, session_token, args.profile, region)
+        if cached_region:
+            logger.info("Using cached bucket region: %s", detected_region)
+        elif args.bucket in _region_cache:
+            _region_cache_store()
+        logger.info("Using AWS region: %s", detected_region)
     else:
-        logger.info(f"Using AWS region: {args.region} (user-specified)")
-
-    # Test S3 access before processing components
-    logger.info("Testing S3 access...")
-    bucket_access_ok = test_s3_access(s3_client, args.bucket)
+        logger.info("Using AWS region: %s (user-specified)", args.region)
+
+    # Test S3 access before processing components, unless the region lookup's
+    # HeadBucket already proved it (it requires s3:ListBucket too)
+    access_error = None
+    if args.skip_preflight:
+        logger.info("Skipping S3 access test (--skip-preflight)")
+        bucket_access_ok = True
+    elif head_ok:
+        logger.info("✓ Bucket access verified during region detection")
+        bucket_access_ok = True
+    else:
+        logger.info("Testing S3 access...")
+        bucket_access_ok, access_error = test_s3_access(s3_client, args.bucket)
+    if cached_region and access_error in _REGION_MISMATCH_CODES:
+        # The saved region is stale (e.g., the bucket was recreated
+        # elsewhere); forget it so the next run detects the region again.
+        # Other failures (expired credentials, AccessDenied) keep it.
+        _region_cache.pop(args.bucket, None)
+        _region_cache_store()
+        logger.warning(
+            "Cleared cached region '%s' for bucket '%s'", cached_region, args.bucket)
     if not bucket_access_ok:
         logger.error(
             "Failed to access S3 bucket. Please check your credentials and permissions."
@@ -974,7 +1537,7 @@ def main() -> int:
             "  - s3:PutObject (required by copy_object to write destination files)"
         )
         return 1
-    else:
+    elif not (args.skip_preflight or head_ok):
         logger.info("✓ Initial bucket access test passed")
 
     if args.dry_run:
@@ -990,13 +1553,14 @@ def main() -> int:
         logger.error("No component mappings found. Exiting.")
         return 1
 
-    logger.info(f"Loaded {len(component_mappings)} component mapping(s)")
+    logger.info("Loaded %d component mapping(s)", len(component_mappings))
+    mapping_index = build_mapping_index(component_mappings)
 
     # Load component names to process
     if args.components:
         # Use components from command line (comma-separated)
         component_names = [comp.strip() for comp in args.components.split(",") if comp.strip()]
-        logger.info(f"Using components from command line: {len(component_names)} component(s)")
+        logger.info("Using components from command line: %d component(s)", len(component_names))
     else:
         # Load from file
         component_names = load_component_names(components_file_path)
@@ -1005,45 +1569,102 @@ def main() -> int:
         logger.error("No component names found. Exiting.")
         return 1
 
-    logger.info(f"Found {len(component_names)} component(s) to process\n")
+    # Drop repeated names (keeping first-seen order) so each file is copied once
+    total_names = len(component_names)
+    component_names = list(dict.fromkeys(component_names))
+    if len(component_names) != total_names:
+        logger.info(
+            "Deduplicated %d repeated component name(s)",
+            total_names - len(component_names),
+        )
+
+    logger.info("Found %d component(s) to process\n", len(component_names))
 
-    # Process each component
-    success_count = 0
-    failure_count = 0
-    not_found_count = 0
+    # Resolve every mapping up front so components without one fail here,
+    # before any S3 work, and only real copies reach the thread pool
     successful_components = []
     failed_components = []
 
-    for i, component_name in enumerate(component_names, 1):
-        logger.info(
-            f"\n[{i}/{len(component_names)}] Processing: {component_name}")
-        logger.info("-" * 80)
-
-        # Find matching mapping
+    present = []
+    missing = []
+    for component_name in component_names:
         component_config = find_component_mapping(
-            component_name, component_mappings)
-
-        if not component_config:
-            logger.error(f"No mapping found for component '{component_name}'")
-            not_found_count += 1
-            failure_count += 1
-            failed_components.append(component_name)
-            continue
+            component_name, component_mappings, mapping_index)
+        if component_config:
+            present.append((component_name, component_config))
+        else:
+            missing.append(component_name)
 
-        if copy_component_file(
-            component_name,
-            component_config,
-            args.bucket,
+    if missing:
+        logger.error(
+            "No mapping found for %d component(s): %s",
+            len(missing),
+            ", ".join(missing),
+        )
+        failed_components.extend(missing)
+
+    # List the source directories once so dry-run existence checks under a
+    # listed directory need no request (real copies do not check existence
+    # up front)
+    existing_keys = listed_prefixes = None
+    if args.dry_run and present:
+        existing_keys, listed_prefixes = build_existence_set(
             s3_client,
-            source_prefix=args.source_prefix,
-            destination_prefix=args.destination_prefix,
-            dry_run=args.dry_run,
-        ):
-            success_count += 1
-            successful_components.append(component_name)
-        else:
-            failure_count += 1
-            failed_components.append(component_name)
+            args.bucket,
+            collect_source_prefixes(present, args.source_prefix),
+        )
+
+    log_progress = logger.isEnabledFor(logging.INFO)
+
+    def process_component(
+        item: Tuple[int, Tuple[str, Dict[str, str]]]
+    ) -> Tuple[bool, List[logging.LogRecord]]:
+        """Copy one mapped component, returning its result and held-back records."""
+        i, (component_name, component_config) = item
+        _thread_log.records = records = []
+        try:
+            if log_progress:
+                # Header and separator in one record
+                logger.info(
+                    "\n[%d/%d] Processing: %s\n%s",
+                    i, len(present), component_name, _SEPARATOR)
+
+            result = copy_component_file(
+                component_name,
+                component_config,
+                args.bucket,
+                s3_client,
+                source_prefix=args.source_prefix,
+                destination_prefix=args.destination_prefix,
+                dry_run=args.dry_run,
+                existing_keys=existing_keys,
+                listed_prefixes=listed_prefixes,
+            )
+        finally:
+            _thread_log.records = None
+        return result, records
+
+    # Copies are network-bound, so run them concurrently; map() yields results
+    # in submission order, so each component's records are emitted together
+    # and in order as soon as it and those before it finish. All workers share
+    # s3_client: calls on a client are thread-safe and its connection pool is
+    # sized for the workers.
+    if present:
+        max_workers = min(args.concurrency, len(present))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outcomes = executor.map(process_component, enumerate(present, 1))
+            for (component_name, _), (result, records) in zip(present, outcomes):
+                for record in records:
+                    logger.handle(record)
+                if result:
+                    successful_components.append(component_name)
+                else:
+                    failed_components.append(component_name)
+
+    # Counts come straight from the lists (unmapped components are failures)
+    success_count = len(successful_components)
+    failure_count = len(failed_components)
+    not_found_count = len(missing)
 
     # Summary
     logger.info("\n" + "=" * 80)
@@ -1052,21 +1673,27 @@ def main() -> int:
     else:
         logger.info("SUMMARY")
     logger.info("=" * 80)
-    logger.info(f"Total components to process: {len(component_names)}")
-    logger.info(f"Successful: {success_count}")
-    logger.info(f"Failed: {failure_count}")
-
-    if successful_components:
+    logger.info("Total components to process: %d", len(component_names))
+    logger.info("Successful: %d", success_count)
+    logger.info("Failed: %d", failure_count)
+
+    # One record per list: a single handler call however long the run, and
+    # the lists are only joined when INFO records are emitted
+    log_lists = logger.isEnabledFor(logging.INFO)
+    if successful_components and log_lists:
         logger.info(
-            f"\n✓ Successfully processed components ({len(successful_components)}):"
+            "\n✓ Successfully processed components (%d):\n%s",
+            len(successful_components),
+            "\n".join(f"  - {comp}" for comp in successful_components),
         )
-        for comp in successful_components:
-            logger.info(f"  - {comp}")
 
     if failed_components:
-        logger.info(f"\n✗ Failed components ({len(failed_components)}):")
-        for comp in failed_components:
-            logger.info(f"  - {comp}")
+        if log_lists:
+            logger.info(
+                "\n✗ Failed components (%d):\n%s",
+                len(failed_components),
+                "\n".join(f"  - {comp}" for comp in failed_components),
+            )
         logger.info(
             "\nNote: If some components succeeded and others failed with permission errors,"
         )
@@ -1078,7 +1705,7 @@ def main() -> int:
         )
 
     if not_found_count > 0:
-        logger.info(f"  - No mapping found: {not_found_count}")
+        logger.info("  - No mapping found: %d", not_found_count)
     if args.dry_run:
         logger.info(
             "\nTo actually perform the copy operations, run without --dry-run flag"
@@ -5,17 +5,26 @@ Run this to verify your credentials work before using the main script.
 
 import os
 import sys
-import boto3
 from botocore.exceptions import ClientError
 
+# Reuse the main script's helpers; the project root makes src importable when
+# this file is run directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.s3_component_replacer import (  # noqa: E402
+    _mask,
+    _sanitize,
+    get_bucket_region,
+    get_s3_client,
+)
+
 
 def test_aws_s3_access():
     """Test AWS credentials and S3 bucket access."""
 
-    # Get credentials from environment or command line
-    access_key = os.environ.get("AWS_ACCESS_KEY_ID")
-    secret_key = os.environ.get("AWS_SECRET_ACCESS_KEY")
-    session_token = os.environ.get("AWS_SESSION_TOKEN")
+    # Get credentials from environment, sanitized like the main script's
+    access_key = _sanitize(os.environ.get("AWS_ACCESS_KEY_ID"))
+    secret_key = _sanitize(os.environ.get("AWS_SECRET_ACCESS_KEY"))
+    session_token = _sanitize(os.environ.get("AWS_SESSION_TOKEN"))
 
     bucket_name = "example-bucket-name"
 
@@ -33,13 +42,7 @@ def test_aws_s3_access():
             print("  $env:AWS_SESSION_TOKEN='your-token'")
         return 1
 
-    # Sanitize credentials
-    access_key = access_key.strip().replace("\n", "").replace("\r", "")
-    secret_key = secret_key.strip().replace("\n", "").replace("\r", "")
-    if session_token:
-        session_token = session_token.strip().replace("\n", "").replace("\r", "")
-
-    print(f"\nAccess Key: {access_key[:4]}...{access_key[-4:]}")
+    print(f"\nAccess Key: {_mask(access_key)}")
     if session_token:
         print("Session Token: Provided (temporary credentials)")
     else:
@@ -48,56 +51,40 @@ def test_aws_s3_access():
     # Create S3 client
     print(f"\nCreating S3 client for bucket: {bucket_name}")
     try:
-        client_kwargs = {
-            "aws_access_key_id": access_key,
-            "aws_secret_access_key": secret_key,
-            "region_name": "us-east-1",  # Start with default
-        }
-        if session_token:
-            client_kwargs["aws_session_token"] = session_token
-
-        s3_client = boto3.client("s3", **client_kwargs)
+        # Start with the default region
+        s3_client = get_s3_client(
+            access_key, secret_key, session_token, None, "us-east-1")
         print("✓ S3 client created successfully")
     except Exception as e:
         print(f"✗ Failed to create S3 client: {e}")
         return 1
 
-    # Detect bucket region
+    # Detect bucket region (falls back to us-east-1 when it cannot be read;
+    # the listing below then reports any permission problem)
     print("\nDetecting bucket region...")
-    try:
-        response = s3_client.head_bucket(Bucket=bucket_name)
-        region = (
-            response.get("ResponseMetadata", {})
-            .get("HTTPHeaders", {})
-            .get("x-amz-bucket-region")
-        )
-        if not region:
-            location = s3_client.get_bucket_location(Bucket=bucket_name)
-            region = location.get("LocationConstraint") or "us-east-1"
-        print(f"✓ Bucket region: {region}")
-
-        # Recreate client with correct region if needed
-        if region != "us-east-1":
-            print(f"Recreating client with region: {region}")
-            client_kwargs["region_name"] = region
-            s3_client = boto3.client("s3", **client_kwargs)
-    except ClientError as e:
-        error_code = e.response["Error"]["Code"]
-        if error_code == "403":
-            print("✗ Permission denied (403) - Cannot access bucket")
-            print("  Your credentials may be invalid or lack s3:ListBucket permission")
-            return 1
-        else:
-            print(f"✗ Error detecting region: {error_code}")
-            return 1
-    except Exception as e:
-        print(f"✗ Unexpected error: {e}")
-        return 1
+    region, _ = get_bucket_region(s3_client, bucket_name)
+    print(f"✓ Bucket region: {region}")
+
+    # Recreate client with correct region if needed
+    if region != "us-east-1":
+        print(f"Recreating client with region: {region}")
+        s3_client = get_s3_client(
+            access_key, secret_key, session_token, None, region)
+
+    # Prefixes the read test may pick an object from; one listing at their
+    # shared root covers them all
+    test_paths = [
+        "dev/krembo/krembo_componentsV2/game_type/slotmachine/",
+        "dev/",
+    ]
+    common_prefix = os.path.commonprefix(test_paths)
 
     # Test list access
     print("\nTesting bucket access (s3:ListBucket)...")
     try:
-        s3_client.list_objects_v2(Bucket=bucket_name, Prefix="dev/", MaxKeys=1)
+        listing = s3_client.list_objects_v2(
+            Bucket=bucket_name, Prefix=common_prefix, MaxKeys=1
+        )
         print("✓ Successfully listed objects (s3:ListBucket permission OK)")
     except ClientError as e:
         error_code = e.response["Error"]["Code"]
@@ -112,35 +99,22 @@ def test_aws_s3_access():
 
     # Test read access (try to head an object)
     print("\nTesting read access (s3:GetObject)...")
-    test_paths = [
-        "dev/krembo/krembo_componentsV2/game_type/slotmachine/",
-        "dev/",
-    ]
-
+    # Head the first object of the listing above instead of listing again
     found_readable = False
-    for test_prefix in test_paths:
+    contents = listing.get("Contents", [])
+    if contents:
+        test_key = contents[0]["Key"]
         try:
-            # Try to list and get first object
-            response = s3_client.list_objects_v2(
-                Bucket=bucket_name, Prefix=test_prefix, MaxKeys=1
-            )
-            if "Contents" in response and len(response["Contents"]) > 0:
-                test_key = response["Contents"][0]["Key"]
-                s3_client.head_object(Bucket=bucket_name, Key=test_key)
-                print(f"✓ Successfully read object: {test_key}")
-                print("  (s3:GetObject permission OK)")
-                found_readable = True
-                break
+            s3_client.head_object(Bucket=bucket_name, Key=test_key)
+            print(f"✓ Successfully read object: {test_key}")
+            print("  (s3:GetObject permission OK)")
+            found_readable = True
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
             if error_code == "403":
-                print(f"  ✗ Permission denied for prefix: {test_prefix}")
-            elif error_code == "404":
-                continue  # No objects in this prefix, try next
-            else:
+                print(f"  ✗ Permission denied for object: {test_key}")
+            elif error_code != "404":
                 print(f"  ✗ Error: {error_code}")
-        except Exception:
-            continue
 
     if not found_readable:
         print("⚠ Could not test read access (no accessible objects found)")
@@ -0,0 +1,220 @@
+"""
+Pytest tests for scripts/list_components.py
+"""
+
+import importlib.util
+import json
+import os
+
+import pytest
+
+# scripts/ is not a package, so load the script as a module from its path
+_SCRIPT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "scripts",
+    "list_components.py",
+)
+_spec = importlib.util.spec_from_file_location("list_components", _SCRIPT)
+list_components = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(list_components)
+
+_MAPPINGS = [
+    {"component_key": "KP-SlotMachine-V2", "path_format": "/a/slot.{0}.min.js"},
+    {"component_key": "FE-BetSlip", "path_format": "/b/betslip.{0}.min.js"},
+    "legacy-string-entry",
+    {"path_format": "/c/no-key.{0}.min.js"},
+    {"component_key": "FE-BetSlip", "path_format": "/d/betslip.{0}.js"},
+]
+_EXPECTED_KEYS = ["FE-BetSlip", "KP-SlotMachine-V2"]
+
+
+@pytest.fixture(params=["ijson", "orjson", "json"])
+def parser(request, monkeypatch):
+    """Run the test once per parsing path, disabling the preferred parsers"""
+    if request.param in ("ijson", "orjson"):
+        pytest.importorskip(request.param)
+    if request.param != "ijson":
+        monkeypatch.setattr(list_components, "ijson", None)
+    if request.param == "json":
+        monkeypatch.setattr(list_components, "orjson", None)
+    return request.param
+
+
+@pytest.fixture
+def mapping_file(tmp_path):
+    """A mapping file with duplicate, legacy and key-less entries"""
+    path = tmp_path / "components_mapping.json"
+    path.write_text(json.dumps(_MAPPINGS))
+    return str(path)
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    """Cache location inside the test's directory"""
+    return str(tmp_path / "cache" / "component_keys.json")
+
+
+class TestReadComponentKeys:
+    """Tests for _read_component_keys function"""
+
+    pytestmark = pytest.mark.io
+
+    def test_read_component_keys_sorted_and_unique(self, parser, mapping_file):
+        """Test that every parser returns the sorted, deduplicated keys"""
+        assert list_components._read_component_keys(mapping_file) == _EXPECTED_KEYS
+
+    def test_read_component_keys_empty_array(self, parser, tmp_path):
+        """Test that an empty mapping array has no keys"""
+        path = tmp_path / "components_mapping.json"
+        path.write_text("[]")
+        assert list_components._read_component_keys(str(path)) == []
+
+
+class TestMain:
+    """Tests for main function"""
+
+    pytestmark = pytest.mark.io
+
+    def test_main_prints_keys(self, parser, mapping_file, cache_file, capsys):
+        """Test the key listing and its comma-separated form"""
+        list_components.main(mapping_file, cache_file)
+
+        out = capsys.readouterr().out
+        assert out == (
+            "Available component keys (2 total):\n\n"
+            "  FE-BetSlip\n"
+            "  KP-SlotMachine-V2\n"
+            "\nComma-separated list:\n"
+            "FE-BetSlip,KP-SlotMachine-V2\n"
+        )
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            pytest.param("invalid json content [", id="malformed"),
+            pytest.param('[{"component_key": "FE-BetSlip"', id="truncated"),
+            pytest.param("", id="empty-file"),
+        ],
+    )
+    def test_main_invalid_json_exits(
+        self, parser, tmp_path, cache_file, capsys, content
+    ):
+        """Test that every parser's decode errors are reported as invalid JSON"""
+        path = tmp_path / "components_mapping.json"
+        path.write_text(content)
+
+        with pytest.raises(SystemExit) as exc_info:
+            list_components.main(str(path), cache_file)
+
+        assert exc_info.value.code == 1
+        assert "Invalid JSON" in capsys.readouterr().err
+        assert not os.path.exists(cache_file)
+
+    def test_main_missing_file_exits(self, tmp_path, cache_file, capsys):
+        """Test that a missing mapping file is reported"""
+        with pytest.raises(SystemExit) as exc_info:
+            list_components.main(str(tmp_path / "missing.json"), cache_file)
+
+        assert exc_info.value.code == 1
+        assert "not found" in capsys.readouterr().err
+
+
+class TestKeyCache:
+    """Tests for the parsed key cache"""
+
+    pytestmark = pytest.mark.io
+
+    def _fail_parse(self, mapping_file):
+        raise AssertionError("mapping file parsed despite a valid cache")
+
+    def test_cache_hit_skips_parsing(
+        self, mapping_file, cache_file, capsys, monkeypatch
+    ):
+        """Test that an unchanged mapping file is served from the cache"""
+        list_components.main(mapping_file, cache_file)
+        first = capsys.readouterr().out
+
+        monkeypatch.setattr(list_components, "_read_component_keys", self._fail_parse)
+        list_components.main(mapping_file, cache_file)
+
+        assert capsys.readouterr().out == first
+
+    def test_cache_is_json(self, mapping_file, cache_file, capsys):
+        """Test that the cache is plain JSON tied to the mapping file"""
+        list_components.main(mapping_file, cache_file)
+
+        with open(cache_file, encoding="utf-8") as f:
+            cached = json.load(f)
+        st = os.stat(mapping_file)
+        assert cached == {
+            "mapping_file": os.path.abspath(mapping_file),
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "keys": _EXPECTED_KEYS,
+        }
+
+    def test_cache_miss_on_size_change(self, mapping_file, cache_file, capsys):
+        """Test that a mapping file of a different size is parsed again"""
+        list_components.main(mapping_file, cache_file)
+        with open(mapping_file, "w", encoding="utf-8") as f:
+            json.dump(_MAPPINGS + [{"component_key": "IN-Lobby"}], f)
+        capsys.readouterr()
+
+        list_components.main(mapping_file, cache_file)
+
+        assert "IN-Lobby" in capsys.readouterr().out
+
+    def test_cache_miss_on_mtime_change(self, mapping_file, cache_file, capsys):
+        """Test that an edit keeping the file size is still detected by mtime"""
+        list_components.main(mapping_file, cache_file)
+        with open(mapping_file, "r", encoding="utf-8") as f:
+            content = f.read()
+        with open(mapping_file, "w", encoding="utf-8") as f:
+            f.write(content.replace("FE-BetSlip", "FE-BetSlap"))
+        st = os.stat(mapping_file)
+        os.utime(mapping_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        capsys.readouterr()
+
+        list_components.main(mapping_file, cache_file)
+
+        out = capsys.readouterr().out
+        assert "FE-BetSlap" in out
+        assert "FE-BetSlip" not in out
+
+    def test_cache_miss_for_other_mapping_file(
+        self, mapping_file, cache_file, tmp_path, capsys
+    ):
+        """Test that a cache written for another mapping file is not used"""
+        list_components.main(mapping_file, cache_file)
+        other = tmp_path / "other" / "components_mapping.json"
+        other.parent.mkdir()
+        other.write_text(json.dumps([{"component_key": "IN-Lobby"}]))
+        os.utime(other, ns=(os.stat(mapping_file).st_atime_ns,
+                            os.stat(mapping_file).st_mtime_ns))
+        capsys.readouterr()
+
+        list_components.main(str(other), cache_file)
+
+        assert "IN-Lobby" in capsys.readouterr().out
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            pytest.param(b"\x80\x04not json", id="binary"),
+            pytest.param(b'{"keys": "FE-BetSlip"}', id="wrong-shape"),
+            pytest.param(b"[1, 2, 3]", id="not-an-object"),
+        ],
+    )
+    def test_corrupt_cache_is_ignored(
+        self, mapping_file, cache_file, capsys, content
+    ):
+        """Test that an unusable cache falls back to parsing the mapping file"""
+        os.makedirs(os.path.dirname(cache_file))
+        with open(cache_file, "wb") as f:
+            f.write(content)
+
+        list_components.main(mapping_file, cache_file)
+
+        assert "KP-SlotMachine-V2" in capsys.readouterr().out
+        with open(cache_file, encoding="utf-8") as f:
+            assert json.load(f)["keys"] == _EXPECTED_KEYS